@@ -12,3 +12,9 @@ M4_TARBALL_URL = (
 
 M4_TARBALL_PATH = DATA_DIR / "M4comp2018_0.2.0.tar.gz"
 RDA_PATH = DATA_DIR / "M4.rda"  # we’ll copy/rename here
+
+# Known-good SHA-256 of the tarball (sha256sum M4comp2018_0.2.0.tar.gz).
+# When set, every download, including the streaming one, is verified
+# against it. When None, the SHA-256 of each file is recorded the first
+# time it is seen and later runs check the file has not changed since.
+M4_TARBALL_SHA256 = None
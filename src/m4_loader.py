@@ -14,14 +14,50 @@ Design goals:
     - filtering series by period and type (using factor codes).
 """
 
+import functools
+import gc
+import gzip
+import hashlib
+import shutil
 import tarfile
-import urllib.request
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 
 import numpy as np
+import urllib3
 from rpy2.robjects import r, globalenv
 
-from config import M4_TARBALL_URL, M4_TARBALL_PATH, RDA_PATH, DATA_DIR
+try:  # ISA-L accelerated inflate, if installed (pip install isal)
+    from isal import igzip as _gzip_impl
+except ImportError:
+    _gzip_impl = gzip
+
+from config import (
+    M4_TARBALL_URL,
+    M4_TARBALL_PATH,
+    M4_TARBALL_SHA256,
+    RDA_PATH,
+    DATA_DIR,
+)
+
+
+# Buffer size used when streaming archive members / downloads to disk.
+COPY_BUFSIZE = 1 << 20  # 1 MiB
+
+# Number of series extracted between explicit garbage collections. Python
+# cannot see the size of R-backed objects, so it would otherwise collect
+# them too late during long extraction loops.
+GC_EVERY_N_SERIES = 1024
+
+# Shared HTTP connection pool for all downloads, retrying transient
+# connection errors and gateway failures with exponential backoff.
+_HTTP = urllib3.PoolManager(
+    retries=urllib3.Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+    )
+)
 
 
 # ---------------------------------------------------------------------------
@@ -32,27 +68,28 @@ from config import M4_TARBALL_URL, M4_TARBALL_PATH, RDA_PATH, DATA_DIR
 # In R:
 #   levels(M4[[1]]$period) -> "Daily" "Hourly" "Monthly" "Quarterly" "Weekly "Yearly"
 #   levels(M4[[1]]$type)   -> "Demographic" "Finance" "Industry" "Macro" "Micro" "Other"
+# Codes are the 1-based integer factor codes, matching as.integer(...) in R.
 
 PERIOD_LABEL_TO_CODE = {
-    "Daily": "1",
-    "Hourly": "2",
-    "Monthly": "3",
-    "Quarterly": "4",
-    "Weekly": "5",
-    "Yearly": "6",
+    "Daily": 1,
+    "Hourly": 2,
+    "Monthly": 3,
+    "Quarterly": 4,
+    "Weekly": 5,
+    "Yearly": 6,
 }
 
 TYPE_LABEL_TO_CODE = {
-    "Demographic": "1",
-    "Finance": "2",
-    "Industry": "3",
-    "Macro": "4",
-    "Micro": "5",
-    "Other": "6",
+    "Demographic": 1,
+    "Finance": 2,
+    "Industry": 3,
+    "Macro": 4,
+    "Micro": 5,
+    "Other": 6,
 }
 
 
-def get_m4_factor_codes(m4_r_object, index: int) -> tuple[str, str]:
+def get_m4_factor_codes(m4_r_object, index: int) -> tuple[int, int]:
     """
     Return the factor codes for 'period' and 'type' of a given M4 series.
 
@@ -65,29 +102,165 @@ def get_m4_factor_codes(m4_r_object, index: int) -> tuple[str, str]:
 
     Returns
     -------
-    (str, str)
-        Tuple (period_code, type_code), both as strings '1'..'6'.
+    (int, int)
+        Tuple (period_code, type_code), both as integers 1..6.
 
         These codes correspond to the R factor levels documented above, e.g.:
-        period_code '4' -> "Quarterly"
-        type_code   '2' -> "Finance"
+        period_code 4 -> "Quarterly"
+        type_code   2 -> "Finance"
     """
     s = m4_r_object.rx2(index)
-    period_code = str(s.rx2("period")[0])  # factor code as string '1'..'6'
-    type_code = str(s.rx2("type")[0])      # factor code as string '1'..'6'
+    period_code = int(s.rx2("period")[0])  # factor code as int 1..6
+    type_code = int(s.rx2("type")[0])      # factor code as int 1..6
     return period_code, type_code
 
 
+# Vectorised accessor: one R call returns the period and type codes of
+# every series, avoiding a Python<->R round trip per series.
+_R_FACTOR_CODES = r(
+    """
+    function(m4) {
+        list(
+            period = vapply(m4, function(s) as.integer(s$period), integer(1)),
+            type   = vapply(m4, function(s) as.integer(s$type), integer(1))
+        )
+    }
+    """
+)
+
+
+def get_m4_factor_code_arrays(m4_r_object) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the 'period' and 'type' factor codes of all M4 series at once.
+
+    Parameters
+    ----------
+    m4_r_object : rpy2 ListVector
+        The M4 object as loaded from M4.rda (via load_m4_r_object()).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        Tuple (periods, types) of integer arrays of length len(m4_r_object).
+        Position i holds the codes of the series M4[[i + 1]].
+    """
+    codes = _R_FACTOR_CODES(m4_r_object)
+    periods = np.asarray(codes.rx2("period"), dtype=int)
+    types = np.asarray(codes.rx2("type"), dtype=int)
+    return periods, types
+
+
 # ---------------------------------------------------------------------------
 # Download and extract M4.rda from the M4comp2018 tarball
 # ---------------------------------------------------------------------------
 
+def _is_m4_data_member(member: tarfile.TarInfo) -> bool:
+    """Return True if the tar member is the packaged M4 dataset file."""
+    # Package data is usually under "M4comp2018/data/M4.rda" or "M4.RData"
+    name = member.name.lower()
+    return name.endswith("/data/m4.rda") or name.endswith("/data/m4.rdata")
+
+
+def _partial_path(path: Path) -> Path:
+    """Temporary path a file is written to before being moved into place."""
+    return path.with_name(path.name + ".part")
+
+
+def _sha256_sidecar(path: Path) -> Path:
+    """Path of the sidecar file caching the SHA-256 of `path`."""
+    return path.with_name(path.name + ".sha256")
+
+
+def _stat_stamp(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size} {st.st_mtime_ns}"
+
+
+def _sha256(path: Path) -> str:
+    """Hash `path` in chunks so large files are never read whole."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_BUFSIZE):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _record_sha256(path: Path, digest: str | None = None) -> str:
+    """Record the SHA-256 of `path` (computed if not given) in its sidecar."""
+    if digest is None:
+        digest = _sha256(path)
+    _sha256_sidecar(path).write_text(f"{digest} {_stat_stamp(path)}\n")
+    return digest
+
+
+def _verify_sha256(path: Path, expected: str | None = None) -> bool:
+    """
+    Check the content of `path` against a SHA-256 digest.
+
+    The digest is compared to `expected` if given, otherwise to the digest
+    previously recorded in the file's sidecar. Without either (no pin and a
+    file we have not seen before, e.g. a tarball copied into data/ by hand)
+    the file is trusted and its digest recorded. Re-hashing is skipped
+    while the file's size and mtime match those stored in the sidecar.
+    """
+    recorded = None
+    try:
+        digest, stamp = _sha256_sidecar(path).read_text().split(maxsplit=1)
+        recorded = digest
+        if stamp.strip() == _stat_stamp(path):
+            return expected is None or digest == expected.lower()
+    except (FileNotFoundError, ValueError):
+        pass
+
+    digest = _sha256(path)
+    if expected is not None:
+        ok = digest == expected.lower()
+    else:
+        ok = recorded is None or digest == recorded
+    if ok:
+        _record_sha256(path, digest)
+    return ok
+
+
+class _HashingReader:
+    """File-like wrapper that SHA-256 hashes every byte read through it."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.hash = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._fileobj.read(size)
+        self.hash.update(data)
+        return data
+
+
+def _check_tarball_digest(digest: str) -> None:
+    """Raise if `digest` does not match the pinned M4_TARBALL_SHA256."""
+    if M4_TARBALL_SHA256 is not None and digest != M4_TARBALL_SHA256.lower():
+        raise RuntimeError(
+            f"SHA-256 of the downloaded tarball ({digest}) does not match "
+            f"M4_TARBALL_SHA256 ({M4_TARBALL_SHA256})."
+        )
+
+
+def _replace_verified(part_path: Path, path: Path, digest: str | None = None) -> None:
+    """Move a fully written `part_path` over `path` and record its SHA-256."""
+    _sha256_sidecar(path).unlink(missing_ok=True)
+    part_path.replace(path)
+    _record_sha256(path, digest)
+
+
 def download_m4_tarball(force: bool = False) -> Path:
     """
     Download the M4comp2018 source tarball into DATA_DIR.
 
     This fetches the R package tar.gz from GitHub and stores it at
-    M4_TARBALL_PATH, unless it already exists and force=False.
+    M4_TARBALL_PATH, unless it already exists and force=False. An existing
+    or freshly downloaded tarball is checked against M4_TARBALL_SHA256
+    (or, if that is None, against the SHA-256 recorded when the file was
+    first seen); an existing file that fails the check is downloaded
+    again.
 
     Parameters
     ----------
@@ -102,11 +275,39 @@ def download_m4_tarball(force: bool = False) -> Path:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     if M4_TARBALL_PATH.exists() and not force:
-        print(f"Tarball already exists at: {M4_TARBALL_PATH}")
-        return M4_TARBALL_PATH
+        if _verify_sha256(M4_TARBALL_PATH, M4_TARBALL_SHA256):
+            print(f"Tarball already exists at: {M4_TARBALL_PATH}")
+            return M4_TARBALL_PATH
+        print(f"Could not verify {M4_TARBALL_PATH}, downloading again.")
 
     print(f"Downloading M4comp2018 tarball from:\n  {M4_TARBALL_URL}")
-    urllib.request.urlretrieve(M4_TARBALL_URL, M4_TARBALL_PATH)
+    part_path = _partial_path(M4_TARBALL_PATH)
+    resp = _HTTP.request("GET", M4_TARBALL_URL, preload_content=False)
+    try:
+        if resp.status != 200:
+            raise RuntimeError(
+                f"Failed to download {M4_TARBALL_URL} (HTTP {resp.status})."
+            )
+        with open(part_path, "wb") as f_out:
+            shutil.copyfileobj(resp, f_out, length=COPY_BUFSIZE)
+    except BaseException:
+        # Don't hand a half-read connection back to the pool or leave a
+        # partial download behind.
+        resp.close()
+        part_path.unlink(missing_ok=True)
+        raise
+    finally:
+        resp.release_conn()
+
+    # Only move the file into place once it is complete, so an interrupted
+    # download never looks like a valid tarball.
+    digest = _sha256(part_path)
+    try:
+        _check_tarball_digest(digest)
+    except RuntimeError:
+        part_path.unlink()
+        raise
+    _replace_verified(part_path, M4_TARBALL_PATH, digest)
     print(f"Saved to: {M4_TARBALL_PATH}")
     return M4_TARBALL_PATH
 
@@ -135,6 +336,12 @@ def extract_m4_rda_from_tarball(
     -------
     Path
         Path to the extracted RDA file (RDA_PATH).
+
+    Notes
+    -----
+    An existing M4.rda is reused only if it still matches the SHA-256
+    recorded when it was extracted. The default tarball is checked against
+    M4_TARBALL_SHA256 (or its recorded SHA-256) before extracting.
     """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -145,17 +352,31 @@ def extract_m4_rda_from_tarball(
         raise FileNotFoundError(f"Tarball not found at: {tar_path}")
 
     if RDA_PATH.exists() and not force:
-        print(f"M4.rda already exists at: {RDA_PATH}")
-        return RDA_PATH
+        if _verify_sha256(RDA_PATH):
+            print(f"M4.rda already exists at: {RDA_PATH}")
+            return RDA_PATH
+        print(f"Could not verify {RDA_PATH}, extracting again.")
+
+    if Path(tar_path).resolve() == M4_TARBALL_PATH.resolve() and not _verify_sha256(
+        M4_TARBALL_PATH, M4_TARBALL_SHA256
+    ):
+        raise RuntimeError(
+            f"Tarball at {tar_path} failed SHA-256 verification; "
+            "re-download it with download_m4_tarball(force=True)."
+        )
 
     print(f"Extracting M4.* from tarball: {tar_path}")
 
-    with tarfile.open(tar_path, "r:gz") as tar:
+    # Decompress through a 1 MiB-buffered file and read the tar in streaming
+    # mode ("r|"), which avoids tarfile's small default read size.
+    with open(tar_path, "rb", buffering=COPY_BUFSIZE) as raw, \
+            _gzip_impl.GzipFile(fileobj=raw) as gz, \
+            tarfile.open(fileobj=gz, mode="r|", bufsize=COPY_BUFSIZE) as tar:
         member_to_extract = None
-        for member in tar.getmembers():
-            # Package data is usually under "M4comp2018/data/M4.rda" or "M4.RData"
-            name = member.name.lower()
-            if name.endswith("/data/m4.rda") or name.endswith("/data/m4.rdata"):
+        # Iterate lazily so gzip decompression is incremental and we stop
+        # at the first match instead of indexing the whole archive.
+        for member in tar:
+            if _is_m4_data_member(member):
                 member_to_extract = member
                 break
 
@@ -168,17 +389,112 @@ def extract_m4_rda_from_tarball(
         if extracted_file is None:
             raise RuntimeError("Failed to extract M4 data file from tarball.")
 
-        with open(RDA_PATH, "wb") as f_out:
-            f_out.write(extracted_file.read())
+        # Stream to disk in 1 MiB chunks rather than reading the whole
+        # member into memory.
+        with open(_partial_path(RDA_PATH), "wb") as f_out:
+            shutil.copyfileobj(extracted_file, f_out, length=COPY_BUFSIZE)
+        _replace_verified(_partial_path(RDA_PATH), RDA_PATH)
 
     print(f"Extracted {member_to_extract.name} -> {RDA_PATH}")
     return RDA_PATH
 
 
+def fetch_and_extract_m4_rda(force: bool = False) -> Path:
+    """
+    Download the M4comp2018 tarball and extract M4.rda in a single pass.
+
+    The HTTP response is piped straight through gunzip and the tar reader,
+    so the tarball is never written to disk and extraction starts before
+    the download has finished. Use download_m4_tarball() and
+    extract_m4_rda_from_tarball() instead if you want to keep the tarball
+    around for offline use.
+
+    The streamed bytes are hashed as they are read and, if
+    M4_TARBALL_SHA256 is set, checked against it before M4.rda is moved
+    into place.
+
+    Parameters
+    ----------
+    force : bool, optional
+        If True, overwrite an existing M4.rda.
+
+    Returns
+    -------
+    Path
+        Path to the extracted RDA file (RDA_PATH).
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+
+    if RDA_PATH.exists() and not force:
+        if _verify_sha256(RDA_PATH):
+            print(f"M4.rda already exists at: {RDA_PATH}")
+            return RDA_PATH
+        print(f"Could not verify {RDA_PATH}, extracting again.")
+
+    print(f"Streaming M4comp2018 tarball from:\n  {M4_TARBALL_URL}")
+
+    resp = _HTTP.request("GET", M4_TARBALL_URL, preload_content=False)
+    try:
+        if resp.status != 200:
+            raise RuntimeError(
+                f"Failed to download {M4_TARBALL_URL} (HTTP {resp.status})."
+            )
+
+        member_name = None
+        part_path = _partial_path(RDA_PATH)
+        reader = _HashingReader(resp)
+        # "r|" is non-seekable streaming mode: members must be read in order.
+        with _gzip_impl.GzipFile(fileobj=reader) as gz, \
+                tarfile.open(fileobj=gz, mode="r|", bufsize=COPY_BUFSIZE) as tar:
+            for member in tar:
+                if not _is_m4_data_member(member):
+                    continue
+
+                extracted_file = tar.extractfile(member)
+                if extracted_file is None:
+                    raise RuntimeError(
+                        "Failed to extract M4 data file from tarball."
+                    )
+
+                with open(part_path, "wb") as f_out:
+                    shutil.copyfileobj(extracted_file, f_out, length=COPY_BUFSIZE)
+                member_name = member.name
+                break
+
+        if member_name is None:
+            raise FileNotFoundError(
+                "Could not find M4.rda or M4.RData inside the tarball."
+            )
+
+        # We stop reading after the data member; hash the rest of the body
+        # too, which also leaves the connection reusable.
+        while reader.read(COPY_BUFSIZE):
+            pass
+        _check_tarball_digest(reader.hash.hexdigest())
+    except BaseException:
+        # Don't hand a half-read connection back to the pool or keep a
+        # partial / unverified M4.rda around.
+        resp.close()
+        _partial_path(RDA_PATH).unlink(missing_ok=True)
+        raise
+    finally:
+        resp.release_conn()
+
+    _replace_verified(part_path, RDA_PATH)
+    print(f"Extracted {member_name} -> {RDA_PATH}")
+    return RDA_PATH
+
+
 # ---------------------------------------------------------------------------
 # R bridge: load and inspect the M4 object
 # ---------------------------------------------------------------------------
 
+# Most recently loaded M4 object as (resolved RDA path, size/mtime stamp,
+# object). Only one entry is kept, since each M4 object holds hundreds of MB
+# in R; the stamp makes a replaced file load again.
+_M4_CACHE: tuple[Path, str, object] | None = None
+
+
 def load_m4_r_object(rda_path: Path | None = None):
     """
     Load the M4 object from an RDA file using R (via rpy2).
@@ -203,7 +519,13 @@ def load_m4_r_object(rda_path: Path | None = None):
     - This mirrors the behaviour of:
         library(M4comp2018)
         data(M4)
+    - The most recently loaded object is cached: calling it again for the
+      same unchanged file returns that object (and makes it the R "M4"
+      again) instead of re-parsing the RDA. Loading a different file
+      replaces the cached object.
     """
+    global _M4_CACHE
+
     if rda_path is None:
         rda_path = RDA_PATH
 
@@ -211,6 +533,17 @@ def load_m4_r_object(rda_path: Path | None = None):
     if not rda_path.exists():
         raise FileNotFoundError(f"M4.rda not found at: {rda_path}")
 
+    stamp = _stat_stamp(rda_path)
+    if _M4_CACHE is not None and _M4_CACHE[:2] == (rda_path, stamp):
+        m4 = _M4_CACHE[2]
+        # Keep the R-side M4 pointing at the object we return
+        globalenv["M4"] = m4
+        print(f"Using already loaded M4 from: {rda_path}")
+        return m4
+
+    # Release the previous object before loading the next one
+    _M4_CACHE = None
+
     print(f"Loading M4 from: {rda_path}")
 
     # Clear any previous M4 in R global env
@@ -225,10 +558,49 @@ def load_m4_r_object(rda_path: Path | None = None):
         )
 
     m4 = globalenv["M4"]
+    _M4_CACHE = (rda_path, stamp, m4)
     print(f"Retrieved M4 object from R. Total series: {len(m4)}")
     return m4
 
 
+class _RVectorView:
+    """
+    numpy array-interface holder that keeps an R vector alive.
+
+    Arrays built from it get this object as their base, so the rpy2 vector
+    (and with it the R memory the array points at) lives as long as the
+    array does.
+    """
+
+    def __init__(self, value, view: np.ndarray):
+        self._value = value
+        self._view = view
+        interface = dict(view.__array_interface__)
+        interface["data"] = (interface["data"][0], True)  # read-only
+        self.__array_interface__ = interface
+
+
+def _r_numeric_to_numpy(value) -> np.ndarray:
+    """
+    Return an R numeric vector as a numpy float array without copying.
+
+    The array is a read-only view on R-owned memory (via rpy2's
+    memoryview()) and keeps the R vector alive for as long as it exists.
+    Call .copy() to get a writable, independent array. Falls back to a copy
+    when the vector cannot be exposed directly (e.g. non-double storage).
+    """
+    try:
+        view = np.asarray(value.memoryview())
+    except (AttributeError, NotImplementedError, TypeError, ValueError):
+        return np.array(value, dtype=float)
+
+    if view.dtype != np.float64:
+        return view.astype(float)
+
+    # Read-only via the array interface set up by _RVectorView
+    return np.asarray(_RVectorView(value, view))
+
+
 def get_m4_series_py(m4_r_object, index: int) -> dict:
     """
     Extract a single M4 series and convert key fields to Python types.
@@ -250,21 +622,26 @@ def get_m4_series_py(m4_r_object, index: int) -> dict:
             'st'     : series identifier (str)
             'n'      : length of historical data (int)
             'h'      : forecast horizon (int)
-            'period' : factor code as string '1'..'6'
-            'type'   : factor code as string '1'..'6'
+            'period' : factor code as int 1..6
+            'type'   : factor code as int 1..6
             'x'      : numpy array of historical values
             'xx'     : numpy array of future values (true values on horizon)
+
+        The numpy arrays are read-only views on the R vectors, not copies.
+        Each keeps its R vector alive, so it stays valid even after the M4
+        object is reloaded or released; use .copy() to get a writable array.
     """
     s = m4_r_object.rx2(index)  # R-style [[index]]
+    pos = _m4_field_order(s)
 
     out = {
-        "st": str(s.rx2("st")[0]),
-        "n": int(s.rx2("n")[0]),
-        "h": int(s.rx2("h")[0]),
-        "period": str(s.rx2("period")[0]),  # factor code
-        "type": str(s.rx2("type")[0]),      # factor code
-        "x": np.array(s.rx2("x"), dtype=float),
-        "xx": np.array(s.rx2("xx"), dtype=float),
+        "st": str(s[pos["st"]][0]),
+        "n": int(s[pos["n"]][0]),
+        "h": int(s[pos["h"]][0]),
+        "period": int(s[pos["period"]][0]),  # factor code
+        "type": int(s[pos["type"]][0]),      # factor code
+        "x": _r_numeric_to_numpy(s[pos["x"]]),
+        "xx": _r_numeric_to_numpy(s[pos["xx"]]),
     }
     return out
 
@@ -291,6 +668,19 @@ def print_m4_variables(m4_r_object, index: int) -> None:
 # Higher-level helpers: full series extraction and filtering
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _field_positions(names: tuple[str, ...]) -> dict[str, int]:
+    """Return the mapping field name -> position for a series layout."""
+    return {name: i for i, name in enumerate(names)}
+
+
+def _m4_field_order(s) -> dict[str, int]:
+    """Return the mapping field name -> position for the M4 series `s`."""
+    # Keyed on the names themselves, so a series with a different layout
+    # can never be read with another layout's positions.
+    return _field_positions(tuple(s.names))
+
+
 def extract_m4_series(m4_r_object, index: int) -> dict:
     """
     Extract all standard M4 fields for one series into a Python dict.
@@ -313,28 +703,32 @@ def extract_m4_series(m4_r_object, index: int) -> dict:
             'st', 'x', 'n', 'type', 'h', 'period', 'xx',
             'pt_ff', 'up_ff', 'low_ff'.
 
-        'period' and 'type' are kept as factor codes (strings '1'..'6').
+        'period' and 'type' are kept as factor codes (integers 1..6).
         They can be mapped back to labels using the dictionaries:
             PERIOD_LABEL_TO_CODE / TYPE_LABEL_TO_CODE
             and their inverses if needed.
+
+        Numeric vectors are read-only views on R-owned memory rather than
+        copies. Each keeps its R vector alive, so it stays valid even after
+        the M4 object is reloaded or released; use .copy() to get a
+        writable array.
     """
     s = m4_r_object.rx2(index)
-    names = list(s.names)
 
     out: dict[str, object] = {}
 
-    for name in names:
-        value = s.rx2(name)
+    for name, pos in _m4_field_order(s).items():
+        value = s[pos]
 
         if name in ["x", "xx", "pt_ff", "up_ff", "low_ff"]:
-            out[name] = np.array(value, dtype=float)
+            out[name] = _r_numeric_to_numpy(value)
 
         elif name in ["st"]:
             out[name] = str(value[0])
 
         elif name in ["period", "type"]:
-            # Keep factor codes as strings, e.g. '4', '3'
-            out[name] = str(value[0])
+            # Keep factor codes as integers, e.g. 4, 3
+            out[name] = int(value[0])
 
         elif name in ["n", "h"]:
             out[name] = int(value[0])
@@ -346,12 +740,56 @@ def extract_m4_series(m4_r_object, index: int) -> dict:
     return out
 
 
+class LazyM4Map(Mapping):
+    """
+    Read-only mapping of M4 series that extracts each series on first access.
+
+    Keys are 1-based series indices (as in R: M4[[index]]); values are the
+    series dicts returned by extract_m4_series(). Nothing is pulled from R
+    until a series is indexed, and the most recently used series are
+    cached.
+
+    Parameters
+    ----------
+    m4_r_object : rpy2 ListVector
+        The M4 object as returned by load_m4_r_object().
+    indices : iterable of int
+        1-based indices of the series exposed by the mapping.
+    cache_size : int or None, optional
+        Number of extracted series kept in the LRU cache. None means
+        unbounded.
+    """
+
+    def __init__(self, m4_r_object, indices, cache_size: int | None = 1024):
+        self._m4 = m4_r_object
+        self._indices = [int(i) for i in indices]
+        self._index_set = frozenset(self._indices)
+        self._extract = functools.lru_cache(maxsize=cache_size)(
+            functools.partial(extract_m4_series, m4_r_object)
+        )
+
+    def __getitem__(self, idx: int) -> dict:
+        if idx not in self._index_set:
+            raise KeyError(idx)
+        return self._extract(idx)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._indices)
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} series)"
+
+
 def filter_m4_series(
     m4_r_object,
     period: str | None = None,
     type: str | None = None,
     max_series: int | None = None,
-) -> dict[int, dict]:
+    lazy: bool = False,
+) -> Mapping[int, dict]:
     """
     Filter M4 series by 'period' and 'type' labels, using factor codes internally.
 
@@ -367,19 +805,23 @@ def filter_m4_series(
         If None, no filter is applied on type.
     max_series : int or None, optional
         Optional cap on number of series to extract. Useful for tests.
+    lazy : bool, optional
+        If True, return a LazyM4Map that only extracts a series from R when
+        it is accessed, instead of extracting every match up front.
 
     Returns
     -------
-    dict[int, dict]
-        Dictionary mapping series index (1-based, as in R: M4[[index]])
+    dict[int, dict] or LazyM4Map
+        Mapping from series index (1-based, as in R: M4[[index]])
         to the extracted series dict (as returned by extract_m4_series()).
 
     Notes
     -----
     - Users pass human-readable labels (e.g. period="Quarterly", type="Finance").
-    - Internally, these labels are mapped to factor codes ('1'..'6') via
+    - Internally, these labels are mapped to factor codes (1..6) via
       PERIOD_LABEL_TO_CODE and TYPE_LABEL_TO_CODE, and we compare against
-      the factor codes stored in the R object.
+      the factor codes stored in the R object. All codes are fetched in a
+      single R call (get_m4_factor_code_arrays()) rather than per series.
     - This keeps the R M4 object as the main data store and only extracts
       matching series into Python.
     """
@@ -388,23 +830,37 @@ def filter_m4_series(
     type_code = TYPE_LABEL_TO_CODE.get(type) if type else None
 
     n_total = len(m4_r_object)
-    results: dict[int, dict] = {}
-    count = 0
 
-    for idx in range(1, n_total + 1):
-        p_code, t_code = get_m4_factor_codes(m4_r_object, idx)
+    # Fetch all factor codes in a single R call and filter in NumPy
+    periods, types = get_m4_factor_code_arrays(m4_r_object)
+    mask = np.ones(n_total, dtype=bool)
+    if period_code:
+        mask &= periods == period_code
+    if type_code:
+        mask &= types == type_code
+
+    matched = np.flatnonzero(mask) + 1  # R indices are 1-based
+    if max_series:
+        matched = matched[:max_series]
+    matched = matched.tolist()
+
+    if lazy:
+        print(
+            f"Selected {len(matched)} series out of {n_total} "
+            f"(period={period}, type={type}); extracting on access"
+        )
+        return LazyM4Map(m4_r_object, matched)
 
-        if period_code and p_code != period_code:
-            continue
-        if type_code and t_code != type_code:
-            continue
+    results: dict[int, dict] = {}
 
-        # Only extract full series once matched
+    # Only extract full series once matched
+    for count, idx in enumerate(matched, start=1):
         results[idx] = extract_m4_series(m4_r_object, idx)
-        count += 1
 
-        if max_series and count >= max_series:
-            break
+        if count % GC_EVERY_N_SERIES == 0:
+            gc.collect()
+
+    gc.collect()
 
     print(
         f"Selected {len(results)} series out of {n_total} "